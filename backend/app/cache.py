@@ -0,0 +1,113 @@
+"""
+CACHE EM MEMÓRIA (LRU)
+Guarda os produtos mais escaneados no caixa
+Evita ir ao banco a cada leitura de código de barras
+
+ATENÇÃO: o cache vive dentro de UM processo.
+Com `uvicorn --workers N`, cada worker tem seu próprio cache e a
+invalidação feita em um worker não chega aos outros (preço antigo!).
+Rode com um único worker ou use CACHE_CODIGO_BARRAS_TAMANHO=0.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from dotenv import load_dotenv
+
+# Carrega variáveis do arquivo .env
+load_dotenv()
+
+# Tamanho máximo do cache (do .env)
+CACHE_CODIGO_BARRAS_TAMANHO = int(os.getenv("CACHE_CODIGO_BARRAS_TAMANHO", "1000"))
+
+
+class CacheLRU:
+    """
+    Cache LRU (Least Recently Used) thread-safe
+    Quando enche, descarta o item usado há mais tempo
+    Leitura e escrita em O(1)
+    
+    Contador de geração: toda invalidação incrementa o contador.
+    Quem vai buscar no banco lê a geração ANTES da consulta e passa
+    para guardar(); se houve invalidação no meio, o valor (possivelmente
+    antigo) não é guardado.
+    """
+
+    def __init__(self, tamanho_maximo: int):
+        """Recebe quantidade máxima de itens guardados"""
+        self.tamanho_maximo = tamanho_maximo
+        self._itens: "OrderedDict[str, Any]" = OrderedDict()
+        self._chaves_por_id: Dict[int, str] = {}  # id do produto → chave
+        self._lock = threading.Lock()  # Uvicorn atende em várias threads
+        self._geracao = 0  # Incrementado a cada invalidação
+
+    def obter(self, chave: str) -> Optional[Any]:
+        """Retorna item (ou None) e marca como usado recentemente"""
+        with self._lock:
+            valor = self._itens.get(chave)
+            if valor is not None:
+                self._itens.move_to_end(chave)
+            return valor
+
+    def geracao(self) -> int:
+        """Geração atual (ler antes de consultar o banco)"""
+        with self._lock:
+            return self._geracao
+
+    def guardar(
+        self,
+        chave: str,
+        produto_id: int,
+        valor: Any,
+        geracao: Optional[int] = None
+    ) -> None:
+        """
+        Guarda item, descartando o mais antigo se o cache estiver cheio
+        Se `geracao` for informada e o cache tiver sido invalidado
+        desde então, não guarda nada
+        """
+        if self.tamanho_maximo <= 0:
+            return  # Cache desligado
+
+        with self._lock:
+            if geracao is not None and geracao != self._geracao:
+                return  # Houve escrita durante a consulta: valor pode estar velho
+
+            self._itens[chave] = valor
+            self._itens.move_to_end(chave)
+            self._chaves_por_id[produto_id] = chave
+
+            if len(self._itens) > self.tamanho_maximo:
+                chave_antiga, antigo = self._itens.popitem(last=False)
+                self._esquecer_id(chave_antiga, antigo)
+
+    def invalidar(self, chave: Optional[str] = None, produto_id: Optional[int] = None) -> None:
+        """Remove item pela chave e/ou pelo id do produto"""
+        with self._lock:
+            self._geracao += 1
+            if produto_id is not None:
+                chave_antiga = self._chaves_por_id.pop(produto_id, None)
+                if chave_antiga is not None:
+                    self._itens.pop(chave_antiga, None)
+            if chave is not None:
+                valor = self._itens.pop(chave, None)
+                if valor is not None:
+                    self._esquecer_id(chave, valor)
+
+    def _esquecer_id(self, chave: str, valor: Any) -> None:
+        """Remove o índice id → chave, se ainda apontar para esta chave"""
+        produto_id = getattr(valor, "id", None)
+        if self._chaves_por_id.get(produto_id) == chave:
+            del self._chaves_por_id[produto_id]
+
+    def limpar(self) -> None:
+        """Esvazia o cache"""
+        with self._lock:
+            self._geracao += 1
+            self._itens.clear()
+            self._chaves_por_id.clear()
+
+
+# Instância única compartilhada entre requisições
+cache_codigo_barras = CacheLRU(CACHE_CODIGO_BARRAS_TAMANHO)
@@ -39,6 +39,7 @@ app.add_middleware(
     allow_credentials=True,     # Permite cookies
     allow_methods=["*"],        # Todos métodos HTTP
     allow_headers=["*"],        # Todos cabeçalhos
+    expose_headers=["ETag"],    # Frontend lê ETag para revalidar (304)
 )
 
 # Registra rotas
@@ -2,6 +2,7 @@
 CREATE TABLE IF NOT EXISTS produto (
     id SERIAL PRIMARY KEY,
     nome VARCHAR(100) NOT NULL,
+    codigo_barras VARCHAR(14),
     descricao VARCHAR(255),
     preco DECIMAL(10,2) NOT NULL CHECK (preco > 0),
     qtd_estoque INTEGER NOT NULL DEFAULT 0 CHECK (qtd_estoque >= 0),
@@ -12,11 +13,18 @@ CREATE TABLE IF NOT EXISTS produto (
     CONSTRAINT produto_nome_unico UNIQUE (nome)
 );
 
+-- Bancos já existentes: adiciona coluna de código de barras
+ALTER TABLE produto ADD COLUMN IF NOT EXISTS codigo_barras VARCHAR(14);
+
 -- Comentários para documentação
 COMMENT ON TABLE produto IS 'Tabela que armazena os produtos da mercearia';
 COMMENT ON COLUMN produto.preco IS 'Preço de venda do produto (maior que zero)';
 COMMENT ON COLUMN produto.qtd_estoque IS 'Quantidade disponível para venda (não negativa)';
+COMMENT ON COLUMN produto.codigo_barras IS 'Código de barras EAN/GTIN lido no caixa (único)';
 
 -- Índice para otimizar buscas por nome
 CREATE INDEX IF NOT EXISTS idx_produto_nome ON produto(nome);
-CREATE INDEX IF NOT EXISTS idx_produto_ativo ON produto(ativo);
\ No newline at end of file
+CREATE INDEX IF NOT EXISTS idx_produto_ativo ON produto(ativo);
+
+-- Índice único para leitura do scanner (busca exata por igualdade)
+CREATE UNIQUE INDEX IF NOT EXISTS ix_produto_codigo_barras ON produto(codigo_barras);
\ No newline at end of file
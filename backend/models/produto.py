@@ -28,6 +28,12 @@ class Produto(Base):
                   nullable=False,      # NOT NULL
                   index=True)          # Índice para busca por nome
     
+    # Código de barras (EAN-8/EAN-13/GTIN-14) lido pelo scanner do caixa
+    codigo_barras = Column(String(14),        # VARCHAR(14)
+                           unique=True,       # Não pode repetir
+                           nullable=True,     # Produtos antigos podem não ter
+                           index=True)        # Índice único para busca exata
+    
     # Preço de venda - DECIMAL para valores monetários
     preco_venda = Column(DECIMAL(10, 2),  # 10 dígitos, 2 casas decimais
                          nullable=False)
@@ -5,7 +5,7 @@ Isola o banco de dados do resto da aplicação
 
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from fastapi import HTTPException, status
 
 from models.produto import Produto
@@ -31,6 +31,7 @@ class ProdutoRepository:
             # Converter schema para model
             db_produto = Produto(
                 nome=produto.nome,
+                codigo_barras=produto.codigo_barras,
                 preco_venda=produto.preco_venda,
                 qtd_estoque=produto.qtd_estoque
             )
@@ -46,6 +47,10 @@ class ProdutoRepository:
             
             return db_produto
             
+        except IntegrityError as e:
+            # Violação de UNIQUE (código de barras ou nome)
+            self.db.rollback()
+            raise self._erro_integridade(e, produto.nome, produto.codigo_barras, "criar")
         except SQLAlchemyError as e:
             # Em caso de erro, desfazer alterações
             self.db.rollback()
@@ -72,6 +77,25 @@ class ProdutoRepository:
         
         return produto
     
+    # READ - por código de barras
+    def buscar_por_codigo_barras(self, codigo_barras: str) -> Produto:
+        """
+        Busca produto pelo código de barras (leitura do scanner)
+        SQL: SELECT * FROM produto WHERE codigo_barras = ? LIMIT 1
+        Usa o índice único de codigo_barras (busca exata, sem ILIKE)
+        """
+        produto = self.db.query(Produto)\
+                       .filter(Produto.codigo_barras == codigo_barras)\
+                       .first()
+        
+        if not produto:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Produto com código de barras {codigo_barras} não encontrado"
+            )
+        
+        return produto
+    
     # READ - todos (com paginação)
     def listar_todos(self, skip: int = 0, limit: int = 100) -> List[Produto]:
         """
@@ -108,6 +132,11 @@ class ProdutoRepository:
             
             return db_produto
             
+        except IntegrityError as e:
+            self.db.rollback()
+            raise self._erro_integridade(
+                e, produto_update.nome, produto_update.codigo_barras, "atualizar"
+            )
         except SQLAlchemyError as e:
             self.db.rollback()
             raise HTTPException(
@@ -134,6 +163,39 @@ class ProdutoRepository:
                 detail=f"Erro ao deletar produto: {str(e)}"
             )
     
+    # Tradução de erros de integridade
+    def _erro_integridade(
+        self,
+        erro: IntegrityError,
+        nome: Optional[str],
+        codigo_barras: Optional[str],
+        operacao: str
+    ) -> HTTPException:
+        """
+        Converte IntegrityError em HTTPException
+        Só violações de UNIQUE conhecidas viram 409; o resto continua 500
+        """
+        # PostgreSQL (psycopg2) informa o nome da constraint violada
+        diag = getattr(erro.orig, "diag", None)
+        constraint = getattr(diag, "constraint_name", None) or str(erro.orig)
+        
+        if "codigo_barras" in constraint:
+            return HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Código de barras {codigo_barras} já cadastrado"
+            )
+        
+        if "produto_nome_unico" in constraint:
+            return HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Produto com nome '{nome}' já cadastrado"
+            )
+        
+        return HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro ao {operacao} produto: {str(erro)}"
+        )
+    
     # Busca por nome (parcial)
     def buscar_por_nome(self, nome: str) -> List[Produto]:
         """
@@ -3,8 +3,12 @@ ROUTER: Define os endpoints da API
 A "porta de entrada" do backend
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+import hashlib
+import json
+from typing import Any, List
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -34,6 +38,27 @@ def get_produto_service(
     return ProdutoService(produto_repo)
 
 
+# REVALIDAÇÃO (ETag / If-None-Match)
+def responder_com_etag(request: Request, dados: Any) -> Response:
+    """
+    Gera ETag fraca a partir do conteúdo da resposta
+    Se o cliente já tem essa versão (If-None-Match), responde 304 sem corpo
+    Economiza banda no Wi-Fi da loja; a consulta ao banco continua sendo feita
+    """
+    conteudo = jsonable_encoder(dados)
+    corpo = json.dumps(conteudo, sort_keys=True, ensure_ascii=False)
+    etag = f'W/"{hashlib.md5(corpo.encode("utf-8")).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    
+    # If-None-Match pode trazer várias ETags separadas por vírgula
+    if_none_match = request.headers.get("if-none-match", "")
+    etags_cliente = [e.strip() for e in if_none_match.split(",")]
+    if etag in etags_cliente or "*" in etags_cliente:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return JSONResponse(content=conteudo, headers=headers)
+
+
 # ========== ENDPOINTS ==========
 
 @router.post(
@@ -46,12 +71,14 @@ def get_produto_service(
     
     **Validações:**
     - Nome: 1-100 caracteres, não vazio
+    - Código de barras: opcional, 8-14 dígitos, único
     - Preço: > 0, máximo 2 casas decimais  
     - Estoque: ≥ 0 (inteiro não negativo)
     """,
     responses={
         201: {"description": "Produto criado"},
         400: {"description": "Dados inválidos"},
+        409: {"description": "Código de barras ou nome já cadastrado"},
         422: {"description": "Erro de validação"},
         500: {"description": "Erro interno"}
     }
@@ -79,12 +106,14 @@ def criar_produto(
     "/",
     response_model=List[ProdutoResponse],
     summary="Listar produtos",
-    description="Retorna lista paginada de produtos",
+    description="Retorna lista paginada de produtos (suporta If-None-Match)",
     responses={
-        200: {"description": "Lista de produtos"}
+        200: {"description": "Lista de produtos"},
+        304: {"description": "Lista não mudou desde a ETag informada"}
     }
 )
 def listar_produtos(
+    request: Request,
     skip: int = 0,     # ?skip=0 (padrão)
     limit: int = 100,  # ?limit=100 (padrão)
     produto_service: ProdutoService = Depends(get_produto_service)
@@ -98,7 +127,8 @@ def listar_produtos(
         if limit > 1000:
             limit = 1000
             
-        return produto_service.listar_produtos(skip, limit)
+        produtos = produto_service.listar_produtos(skip, limit)
+        return responder_com_etag(request, produtos)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -110,13 +140,15 @@ def listar_produtos(
     "/{produto_id}",
     response_model=ProdutoResponse,
     summary="Buscar produto por ID",
-    description="Retorna os detalhes de um produto específico",
+    description="Retorna os detalhes de um produto específico (suporta If-None-Match)",
     responses={
         200: {"description": "Produto encontrado"},
+        304: {"description": "Produto não mudou desde a ETag informada"},
         404: {"description": "Produto não encontrado"}
     }
 )
 def obter_produto(
+    request: Request,
     produto_id: int,
     produto_service: ProdutoService = Depends(get_produto_service)
 ):
@@ -125,7 +157,37 @@ def obter_produto(
     Busca produto por ID
     """
     try:
-        return produto_service.obter_produto(produto_id)
+        produto = produto_service.obter_produto(produto_id)
+        return responder_com_etag(request, produto)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro interno: {str(e)}"
+        )
+
+
+@router.get(
+    "/codigo/{ean}",
+    response_model=ProdutoResponse,
+    summary="Buscar produto por código de barras",
+    description="Busca exata pelo código de barras lido no caixa (com cache em memória)",
+    responses={
+        200: {"description": "Produto encontrado"},
+        404: {"description": "Produto não encontrado"}
+    }
+)
+def obter_produto_por_codigo_barras(
+    ean: str,
+    produto_service: ProdutoService = Depends(get_produto_service)
+):
+    """
+    GET /produtos/codigo/{ean}
+    Busca produto por código de barras
+    """
+    try:
+        return produto_service.obter_produto_por_codigo_barras(ean.strip())
     except HTTPException:
         raise
     except Exception as e:
@@ -142,7 +204,8 @@ def obter_produto(
     description="Atualiza os dados de um produto existente",
     responses={
         200: {"description": "Produto atualizado"},
-        404: {"description": "Produto não encontrado"}
+        404: {"description": "Produto não encontrado"},
+        409: {"description": "Código de barras ou nome já cadastrado"}
     }
 )
 def atualizar_produto(
@@ -198,12 +261,14 @@ def deletar_produto(
     "/buscar/{nome}",
     response_model=List[ProdutoResponse],
     summary="Buscar produtos por nome",
-    description="Busca produtos cujo nome contenha o termo",
+    description="Busca produtos cujo nome contenha o termo (suporta If-None-Match)",
     responses={
-        200: {"description": "Resultados da busca"}
+        200: {"description": "Resultados da busca"},
+        304: {"description": "Resultados não mudaram desde a ETag informada"}
     }
 )
 def buscar_produtos_por_nome(
+    request: Request,
     nome: str,
     produto_repo: ProdutoRepository = Depends(get_produto_repository)
 ):
@@ -213,7 +278,10 @@ def buscar_produtos_por_nome(
     """
     try:
         produtos = produto_repo.buscar_por_nome(nome)
-        return [ProdutoResponse.model_validate(p) for p in produtos]
+        return responder_com_etag(
+            request,
+            [ProdutoResponse.model_validate(p) for p in produtos]
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
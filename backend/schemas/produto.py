@@ -6,7 +6,16 @@ Define o CONTRATO de entrada/saída da API
 from pydantic import BaseModel, Field, field_validator
 from decimal import Decimal
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
+
+# Código de barras: 8 a 14 dígitos ASCII (EAN-8, EAN-13, GTIN-14)
+PADRAO_CODIGO_BARRAS = r"^[0-9]{8,14}$"
+
+def _limpar_codigo_barras(valor: Any) -> Any:
+    """Remove espaços ANTES da validação de formato (compartilhado entre schemas)"""
+    if isinstance(valor, str):
+        return valor.strip()
+    return valor
 
 class ProdutoBase(BaseModel):
     """
@@ -22,6 +31,13 @@ class ProdutoBase(BaseModel):
         examples=["Arroz 5kg", "Feijão Carioca 1kg"]
     )
     
+    codigo_barras: Optional[str] = Field(
+        None,  # Opcional
+        pattern=PADRAO_CODIGO_BARRAS,  # Só dígitos 0-9, 8 a 14
+        description="Código de barras EAN/GTIN (8-14 dígitos)",
+        examples=["7891234567895"]
+    )
+    
     preco_venda: Decimal = Field(
         ...,
         gt=0,  # greater than 0
@@ -45,6 +61,13 @@ class ProdutoBase(BaseModel):
             raise ValueError("Nome do produto não pode ser vazio")
         return valor.strip()
     
+    # VALIDADOR: Limpa código de barras antes do pattern
+    @field_validator('codigo_barras', mode='before')
+    @classmethod
+    def limpar_codigo_barras(cls, valor: Any) -> Any:
+        """Remove espaços; o formato é checado pelo pattern do Field"""
+        return _limpar_codigo_barras(valor)
+    
     # VALIDADOR: Verifica casas decimais do preço
     @field_validator('preco_venda')
     @classmethod
@@ -74,8 +97,16 @@ class ProdutoUpdate(BaseModel):
         min_length=1,
         max_length=100
     )
+    codigo_barras: Optional[str] = Field(None, pattern=PADRAO_CODIGO_BARRAS)
     preco_venda: Optional[Decimal] = Field(None, gt=0)
     qtd_estoque: Optional[int] = Field(None, ge=0)
+    
+    # VALIDADOR: Mesma regra do ProdutoBase
+    @field_validator('codigo_barras', mode='before')
+    @classmethod
+    def limpar_codigo_barras(cls, valor: Any) -> Any:
+        """Remove espaços; o formato é checado pelo pattern do Field"""
+        return _limpar_codigo_barras(valor)
 
 class ProdutoResponse(ProdutoBase):
     """
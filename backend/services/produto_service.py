@@ -6,6 +6,7 @@ Onde a "inteligência" do sistema fica
 from typing import List
 from decimal import Decimal
 
+from app.cache import cache_codigo_barras
 from repositories.produto_repository import ProdutoRepository
 from schemas.produto import ProdutoCreate, ProdutoUpdate, ProdutoResponse
 
@@ -36,6 +37,10 @@ class ProdutoService:
         # Chama repository para persistir
         produto = self.produto_repo.criar(produto_data)
         
+        # Garante que o cache não tenha entrada antiga para este código
+        if produto.codigo_barras:
+            cache_codigo_barras.invalidar(chave=produto.codigo_barras)
+        
         # Converte model para schema de resposta
         return ProdutoResponse.model_validate(produto)
     
@@ -49,14 +54,37 @@ class ProdutoService:
         produto = self.produto_repo.buscar_por_id(produto_id)
         return ProdutoResponse.model_validate(produto)
     
+    def obter_produto_por_codigo_barras(self, codigo_barras: str) -> ProdutoResponse:
+        """
+        Busca produto pelo código de barras (caixa/scanner)
+        Acerto no cache: sem acesso ao banco
+        Falha no cache: 1 consulta pelo índice e guarda o resultado
+        """
+        produto_cache = cache_codigo_barras.obter(codigo_barras)
+        if produto_cache is not None:
+            return produto_cache
+        
+        # Geração lida ANTES da consulta: se um PUT/DELETE invalidar o
+        # cache enquanto lemos o banco, o resultado não é guardado
+        geracao = cache_codigo_barras.geracao()
+        produto = self.produto_repo.buscar_por_codigo_barras(codigo_barras)
+        resposta = ProdutoResponse.model_validate(produto)
+        cache_codigo_barras.guardar(codigo_barras, resposta.id, resposta, geracao)
+        return resposta
+    
     def atualizar_produto(self, produto_id: int, produto_data: ProdutoUpdate) -> ProdutoResponse:
         """Atualiza produto existente"""
         produto = self.produto_repo.atualizar(produto_id, produto_data)
+        
+        # Preço/estoque/código mudaram: remove versão antiga do cache
+        cache_codigo_barras.invalidar(chave=produto.codigo_barras, produto_id=produto_id)
+        
         return ProdutoResponse.model_validate(produto)
     
     def deletar_produto(self, produto_id: int) -> dict:
         """Remove produto"""
         success = self.produto_repo.deletar(produto_id)
+        cache_codigo_barras.invalidar(produto_id=produto_id)
         return {
             "message": "Produto deletado com sucesso",
             "id": produto_id,
@@ -223,6 +223,320 @@ function mostrarAlerta(mensagem, tipo = 'info', tempo = 4000) {
     return alerta;
 }
 
+// Configuração do cache local do catálogo (IndexedDB)
+const CATALOGO_DB_NOME = 'mercearia-catalogo';
+const CATALOGO_DB_VERSAO = 2;  // v2: produtos guardados como { id, versao, produto }
+
+/**
+ * Cache local do catálogo de produtos
+ * - Junta requisições iguais que estão em andamento (uma só chamada HTTP)
+ * - Guarda produtos por id no IndexedDB (sobrevive à troca de tela)
+ * - Revalida com ETag/If-None-Match (resposta 304 = usa o que já temos)
+ *
+ * Versões: cada requisição recebe uma versão crescente ao COMEÇAR.
+ * Uma resposta que começou antes de uma escrita não sobrescreve o produto
+ * mais novo, e uma consulta só é remontada (304) se nenhum de seus
+ * produtos mudou depois dela.
+ */
+const CatalogoCache = {
+    produtos: new Map(),     // id → produto (formato do frontend)
+    versoes: new Map(),      // id → versão do produto guardado (ou da exclusão)
+    consultas: new Map(),    // chave → { chave, etag, ids, lista, versao }
+    emAndamento: new Map(),  // chave → Promise da requisição
+    ultimaVersao: 0,
+    db: null,
+    pronto: null,
+
+    /**
+     * Abre o IndexedDB e carrega o catálogo salvo para a memória
+     * Se o navegador não suportar (ou bloquear), funciona só em memória
+     * @returns {Promise} Promise resolvida quando o cache estiver pronto
+     */
+    abrir() {
+        if (this.pronto) return this.pronto;
+
+        this.pronto = new Promise((resolve) => {
+            if (typeof indexedDB === 'undefined') {
+                resolve();
+                return;
+            }
+
+            const requisicao = indexedDB.open(CATALOGO_DB_NOME, CATALOGO_DB_VERSAO);
+
+            requisicao.onupgradeneeded = (evento) => {
+                const db = requisicao.result;
+
+                // v1 guardava produtos sem versão: descarta e recomeça
+                if (evento.oldVersion < 2) {
+                    ['produtos', 'consultas'].forEach(nome => {
+                        if (db.objectStoreNames.contains(nome)) db.deleteObjectStore(nome);
+                    });
+                }
+                if (!db.objectStoreNames.contains('produtos')) {
+                    db.createObjectStore('produtos', { keyPath: 'id' });
+                }
+                if (!db.objectStoreNames.contains('consultas')) {
+                    db.createObjectStore('consultas', { keyPath: 'chave' });
+                }
+            };
+
+            requisicao.onsuccess = () => {
+                this.db = requisicao.result;
+                const transacao = this.db.transaction(['produtos', 'consultas'], 'readonly');
+                const produtos = transacao.objectStore('produtos').getAll();
+                const consultas = transacao.objectStore('consultas').getAll();
+
+                transacao.oncomplete = () => {
+                    // Dados que chegaram da rede enquanto o banco abria têm prioridade
+                    produtos.result.forEach(registro => {
+                        this.ultimaVersao = Math.max(this.ultimaVersao, registro.versao);
+                        if (!this.versoes.has(registro.id)) {
+                            this.produtos.set(registro.id, registro.produto);
+                            this.versoes.set(registro.id, registro.versao);
+                        }
+                    });
+                    consultas.result.forEach(c => {
+                        if (!this.consultas.has(c.chave)) this.consultas.set(c.chave, c);
+                    });
+                    resolve();
+                };
+                transacao.onerror = () => resolve();
+            };
+
+            requisicao.onerror = () => {
+                console.warn('IndexedDB indisponível, cache apenas em memória:', requisicao.error);
+                resolve();
+            };
+        });
+
+        return this.pronto;
+    },
+
+    /**
+     * Gera versão para uma requisição que está começando
+     * Baseada no relógio para continuar crescendo após recarregar a página
+     * @returns {number} Versão maior que todas as anteriores
+     */
+    novaVersao() {
+        this.ultimaVersao = Math.max(Date.now(), this.ultimaVersao + 1);
+        return this.ultimaVersao;
+    },
+
+    /**
+     * Grava alterações no IndexedDB sem bloquear a tela
+     * @param {Function} operacao - Recebe as stores {produtos, consultas}
+     */
+    persistir(operacao) {
+        if (!this.db) return;
+
+        try {
+            const transacao = this.db.transaction(['produtos', 'consultas'], 'readwrite');
+            operacao({
+                produtos: transacao.objectStore('produtos'),
+                consultas: transacao.objectStore('consultas')
+            });
+            transacao.onerror = () => console.warn('Erro ao gravar cache local:', transacao.error);
+        } catch (erro) {
+            console.warn('Erro ao gravar cache local:', erro);
+        }
+    },
+
+    /**
+     * Executa a requisição só uma vez enquanto houver outra igual em andamento
+     * @param {string} chave - Identifica a requisição
+     * @param {Function} executar - Função que faz a requisição
+     * @returns {Promise} Promise compartilhada (cada chamador recebe sua cópia)
+     */
+    deduplicar(chave, executar) {
+        let promessa = this.emAndamento.get(chave);
+
+        if (!promessa) {
+            promessa = executar().finally(() => this.emAndamento.delete(chave));
+            this.emAndamento.set(chave, promessa);
+        }
+
+        // Cópia rasa para um chamador não alterar a lista do outro
+        return promessa.then(resposta => ({
+            ...resposta,
+            data: Array.isArray(resposta.data) ? [...resposta.data] : resposta.data
+        }));
+    },
+
+    /**
+     * GET com deduplicação e revalidação por ETag
+     * @param {string} chave - Chave da consulta no cache
+     * @param {string} url - URL da API
+     * @param {Object} config - Configuração extra do axios (params, etc.)
+     * @returns {Promise} Resposta com dados já no formato do frontend
+     */
+    buscar(chave, url, config = {}) {
+        return this.deduplicar(chave, async () => {
+            await this.abrir();
+
+            const consulta = this.consultas.get(chave);
+            const emCache = consulta ? this.montar(consulta) : null;
+
+            // Consulta com produto alterado depois dela: não serve mais para 304
+            if (consulta && !emCache) this.removerConsulta(chave);
+
+            let versao = this.novaVersao();
+            let resposta = await this.requisitar(url, config, emCache ? consulta.etag : null);
+
+            // 304: servidor confirma que nada mudou
+            if (resposta.status === 304 && emCache) {
+                resposta.data = emCache;
+                return resposta;
+            }
+
+            // 304 sem cópia local: descarta a consulta e pede a versão completa
+            if (resposta.status === 304) {
+                if (consulta) this.removerConsulta(chave);
+                versao = this.novaVersao();
+                resposta = await this.requisitar(url, config, null);
+
+                if (resposta.status === 304) {
+                    throw {
+                        response: {
+                            status: 304,
+                            data: { detail: 'Servidor respondeu 304 sem cópia local do catálogo' }
+                        }
+                    };
+                }
+            }
+
+            // 200: transforma, normaliza por id e guarda
+            const ehLista = Array.isArray(resposta.data);
+            const produtos = ehLista
+                ? resposta.data.map(transformarParaFrontend)
+                : [transformarParaFrontend(resposta.data)];
+
+            this.salvarProdutos(produtos, versao);
+
+            const etag = resposta.headers && resposta.headers.etag;
+            if (etag) {
+                this.salvarConsulta({ chave, etag, ids: produtos.map(p => p.id), lista: ehLista, versao });
+            } else if (this.consultas.has(chave)) {
+                this.removerConsulta(chave);
+            }
+
+            // Resposta atrasada: mostra o que o cache já tem de mais novo
+            const atuais = produtos
+                .map(p => this.versoes.get(p.id) > versao ? this.produtos.get(p.id) : p)
+                .filter(Boolean);  // Excluído depois que a requisição começou
+
+            resposta.data = ehLista ? atuais : (atuais[0] || produtos[0]);
+            return resposta;
+        });
+    },
+
+    /**
+     * GET que aceita 304 como resposta válida
+     * @param {string} url - URL da API
+     * @param {Object} config - Configuração extra do axios
+     * @param {string|null} etag - ETag para If-None-Match (null = sem condição)
+     * @returns {Promise} Resposta do axios
+     */
+    requisitar(url, config, etag) {
+        return axios.get(url, {
+            ...config,
+            headers: etag ? { 'If-None-Match': etag } : {},
+            validateStatus: (status) => (status >= 200 && status < 300) || status === 304
+        });
+    },
+
+    /**
+     * Remonta o resultado de uma consulta a partir dos produtos guardados
+     * @param {Object} consulta - Consulta salva {etag, ids, lista, versao}
+     * @returns {Array|Object|null} Dados ou null se faltar algum produto
+     *          ou se algum deles mudou depois da consulta
+     */
+    montar(consulta) {
+        if (!consulta.etag) return null;
+
+        const valida = consulta.ids.every(id =>
+            this.produtos.has(id) && this.versoes.get(id) <= consulta.versao
+        );
+        if (!valida) return null;
+
+        const produtos = consulta.ids.map(id => this.produtos.get(id));
+
+        return consulta.lista ? produtos : produtos[0];
+    },
+
+    /**
+     * Atualiza (ou insere) produtos no catálogo local
+     * Ignora produto que já tem versão mais nova (resposta atrasada)
+     * Produto idêntico mantém a versão antiga (consultas continuam válidas)
+     * @param {Array} produtos - Produtos no formato do frontend
+     * @param {number} versao - Versão tirada quando a requisição começou
+     */
+    salvarProdutos(produtos, versao) {
+        const alterados = produtos.filter(p => {
+            if (this.versoes.get(p.id) > versao) return false;
+
+            const atual = this.produtos.get(p.id);
+            return !atual || JSON.stringify(atual) !== JSON.stringify(p);
+        });
+
+        alterados.forEach(p => {
+            this.produtos.set(p.id, p);
+            this.versoes.set(p.id, versao);
+        });
+
+        this.persistir(({ produtos: store }) =>
+            alterados.forEach(p => store.put({ id: p.id, versao, produto: p }))
+        );
+    },
+
+    /**
+     * Remove produto do catálogo local e as consultas que o continham
+     * A versão da exclusão fica registrada para uma resposta atrasada
+     * não trazer o produto de volta
+     * @param {number} id - ID do produto
+     * @param {number} versao - Versão tirada quando o DELETE começou
+     */
+    removerProduto(id, versao) {
+        if (this.versoes.get(id) > versao) return;
+
+        this.produtos.delete(id);
+        this.versoes.set(id, versao);
+
+        const afetadas = [...this.consultas.values()].filter(c => c.ids.includes(id));
+        afetadas.forEach(c => this.consultas.delete(c.chave));
+
+        this.persistir(({ produtos, consultas }) => {
+            produtos.delete(id);
+            afetadas.forEach(c => consultas.delete(c.chave));
+        });
+    },
+
+    salvarConsulta(consulta) {
+        this.consultas.set(consulta.chave, consulta);
+        this.persistir(({ consultas }) => consultas.put(consulta));
+    },
+
+    removerConsulta(chave) {
+        this.consultas.delete(chave);
+        this.persistir(({ consultas }) => consultas.delete(chave));
+    },
+
+    /**
+     * Apaga todo o cache local (memória e IndexedDB)
+     */
+    limpar() {
+        // versoes fica: respostas em andamento não devem repovoar o cache
+        this.produtos.clear();
+        this.consultas.clear();
+        this.persistir(({ produtos, consultas }) => {
+            produtos.clear();
+            consultas.clear();
+        });
+    }
+};
+
+// Começa a carregar o catálogo salvo assim que o script é lido
+CatalogoCache.abrir();
+
 /**
  * Módulo de API para produtos
  */
@@ -235,16 +549,10 @@ const ProdutoAPI = {
      */
     listar: async (skip = 0, limit = 100) => {
         try {
-            const resposta = await axios.get(`${API_BASE_URL}/produtos`, {
+            // Cache já devolve os dados no formato do frontend
+            return await CatalogoCache.buscar(`listar:${skip}:${limit}`, `${API_BASE_URL}/produtos`, {
                 params: { skip, limit }
             });
-            
-            // Transforma dados do backend para frontend
-            if (resposta.data && Array.isArray(resposta.data)) {
-                resposta.data = resposta.data.map(transformarParaFrontend);
-            }
-            
-            return resposta;
         } catch (erro) {
             console.error('Erro ao listar produtos:', erro);
             throw erro;
@@ -272,11 +580,13 @@ const ProdutoAPI = {
             // Transforma dados para formato do backend
             const dadosBackend = transformarParaBackend(produto);
             
+            const versao = CatalogoCache.novaVersao();
             const resposta = await axios.post(`${API_BASE_URL}/produtos`, dadosBackend);
             
             // Transforma resposta para frontend
             if (resposta.data) {
                 resposta.data = transformarParaFrontend(resposta.data);
+                CatalogoCache.salvarProdutos([resposta.data], versao);
             }
             
             return resposta;
@@ -302,14 +612,7 @@ const ProdutoAPI = {
                 };
             }
             
-            const resposta = await axios.get(`${API_BASE_URL}/produtos/${id}`);
-            
-            // Transforma resposta para frontend
-            if (resposta.data) {
-                resposta.data = transformarParaFrontend(resposta.data);
-            }
-            
-            return resposta;
+            return await CatalogoCache.buscar(`produto:${id}`, `${API_BASE_URL}/produtos/${id}`);
         } catch (erro) {
             console.error(`Erro ao buscar produto ID ${id}:`, erro);
             throw erro;
@@ -347,11 +650,13 @@ const ProdutoAPI = {
             // Transforma dados para formato do backend
             const dadosBackend = transformarParaBackend(produto);
             
+            const versao = CatalogoCache.novaVersao();
             const resposta = await axios.put(`${API_BASE_URL}/produtos/${id}`, dadosBackend);
             
             // Transforma resposta para frontend
             if (resposta.data) {
                 resposta.data = transformarParaFrontend(resposta.data);
+                CatalogoCache.salvarProdutos([resposta.data], versao);
             }
             
             return resposta;
@@ -377,7 +682,9 @@ const ProdutoAPI = {
                 };
             }
             
+            const versao = CatalogoCache.novaVersao();
             const resposta = await axios.delete(`${API_BASE_URL}/produtos/${id}`);
+            CatalogoCache.removerProduto(Number(id), versao);
             return resposta;
         } catch (erro) {
             console.error(`Erro ao excluir produto ID ${id}:`, erro);
@@ -396,20 +703,25 @@ const ProdutoAPI = {
                 return { data: [] };
             }
             
-            const resposta = await axios.get(`${API_BASE_URL}/produtos/buscar/${encodeURIComponent(nome)}`);
-            
-            // Transforma dados do backend para frontend
-            if (resposta.data && Array.isArray(resposta.data)) {
-                resposta.data = resposta.data.map(transformarParaFrontend);
-            }
-            
-            return resposta;
+            const termo = nome.trim();
+            return await CatalogoCache.buscar(
+                `buscar:${termo.toLowerCase()}`,
+                `${API_BASE_URL}/produtos/buscar/${encodeURIComponent(termo)}`
+            );
         } catch (erro) {
             console.error(`Erro ao buscar produtos por nome "${nome}":`, erro);
             throw erro;
         }
     },
     
+    /**
+     * Apaga o cache local do catálogo
+     * Útil para forçar uma recarga completa
+     */
+    limparCache: () => {
+        CatalogoCache.limpar();
+    },
+    
     /**
      * Verifica status da API
      * @returns {Promise} Promise com a resposta da API
@@ -497,6 +809,7 @@ if (!document.querySelector('#alert-animations')) {
 
 // Exporta funções e objetos para o escopo global
 window.ProdutoAPI = ProdutoAPI;
+window.CatalogoCache = CatalogoCache;
 window.formatarPreco = formatarPreco;
 window.getClasseEstoque = getClasseEstoque;
 window.mostrarAlerta = mostrarAlerta;
@@ -313,6 +313,37 @@ class GerenciadorProdutos {
         this.elementos.tabelaBody.innerHTML = linhasHTML;
     }
     
+    /**
+     * MÉTODO aplicarProdutoSalvo
+     * Insere ou substitui o produto na lista local, evitando nova listagem
+     * Com busca ativa, refaz a busca (o produto pode não casar com o termo)
+     */
+    async aplicarProdutoSalvo(produtoSalvo) {
+        if (!produtoSalvo || produtoSalvo.id === undefined) return;
+        
+        if (this.elementos.inputBusca.value.trim()) {
+            return this.buscarProdutos();
+        }
+        
+        const indice = this.produtos.findIndex(p => p.id === produtoSalvo.id);
+        
+        if (indice >= 0) {
+            this.produtos[indice] = produtoSalvo;
+        } else {
+            this.produtos.push(produtoSalvo);
+        }
+        
+        this.atualizarTela();
+    }
+    
+    /**
+     * MÉTODO atualizarTela
+     */
+    atualizarTela() {
+        this.atualizarTabela();
+        this.atualizarEstatisticas();
+    }
+    
     /**
      * MÉTODO atualizarEstatisticas
      * CORREÇÃO: Usar preco_venda em vez de preco
@@ -421,7 +452,10 @@ class GerenciadorProdutos {
         try {
             await ProdutoAPI.excluir(id);
             mostrarAlerta(`Produto "${produto.nome}" excluído com sucesso!`, 'success');
-            await this.carregarProdutos();
+            
+            // Remove da lista local (sem recarregar tudo do servidor)
+            this.produtos = this.produtos.filter(p => p.id !== id);
+            this.atualizarTela();
             
         } catch (erro) {
             console.error('Erro ao excluir produto:', erro);
@@ -509,9 +543,9 @@ class GerenciadorProdutos {
             btnSalvar.innerHTML = btnOriginal;
             btnSalvar.disabled = false;
             
-            // Fecha modal e recarrega lista
+            // Fecha modal e atualiza lista local com o produto retornado
             this.fecharModal();
-            await this.carregarProdutos();
+            await this.aplicarProdutoSalvo(resposta.data);
             
         } catch (erro) {
             console.error('Erro ao salvar produto:', erro);
@@ -606,7 +640,7 @@ document.addEventListener('DOMContentLoaded', () => {
             try {
                 const resposta = await ProdutoAPI.criar(produtoTeste);
                 console.log('✅ Produto teste criado:', resposta.data);
-                gerenciadorProdutos.carregarProdutos();
+                gerenciadorProdutos.aplicarProdutoSalvo(resposta.data);
             } catch (erro) {
                 console.error('Erro ao criar produto teste:', erro.response?.data || erro.message);
             }